@@ -11,8 +11,22 @@ import (
 )
 
 type point struct {
-	Pr   float64 `json:"p_r"`
-	RhoR float64 `json:"rho_r"`
+	Pr   float64
+	RhoR float64
+}
+
+// curve mirrors the columnar JSON layout written by scripts/process_lydersen.py
+type curve struct {
+	Pr   []float64 `json:"p_r"`
+	RhoR []float64 `json:"rho_r"`
+}
+
+func (c curve) points() []point {
+	pts := make([]point, len(c.Pr))
+	for i := range c.Pr {
+		pts[i] = point{Pr: c.Pr[i], RhoR: c.RhoR[i]}
+	}
+	return pts
 }
 
 func main() {
@@ -34,7 +48,7 @@ func main() {
 		panic(fmt.Sprintf("Failed to read %s: %v", jsonPath, err))
 	}
 
-	var rawMap map[string][]point
+	var rawMap map[string]curve
 	if err := json.Unmarshal(data, &rawMap); err != nil {
 		panic(err)
 	}
@@ -49,14 +63,14 @@ func main() {
 
 	for k, v := range rawMap {
 		if k == "-1" {
-			satPoints = v
+			satPoints = v.points()
 			continue
 		}
 		tr, err := strconv.ParseFloat(k, 64)
 		if err != nil {
 			panic(fmt.Sprintf("Failed to parse Tr key '%s': %v", k, err))
 		}
-		isotherms = append(isotherms, IsoTemp{Tr: tr, Points: v})
+		isotherms = append(isotherms, IsoTemp{Tr: tr, Points: v.points()})
 	}
 
 	// Sort isotherms by Tr
@@ -1,10 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import json
+
+import orjson
 
 from scripts import extractor
+from scripts.cache import cached
 from scripts.parse import parse_char_prop, parse_lee_kesler_tables, parse_antoine_table, parse_cp_tables
 
 
+def _dump_json(path: str, data) -> None:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _extract_step(input_pdf: str, start: int, end: int, out: str) -> bool:
+    return cached(
+        input_pdf,
+        out,
+        lambda: extractor.extract_pages(
+            input_pdf=input_pdf,
+            start=start,
+            end=end,
+            out=out,
+        ),
+        extra_key=f"{start}-{end}",
+    )
+
+
+def _build_b1(b1_pdf: str, json_out_b1: str) -> bool:
+    def produce():
+        data_properties = parse_char_prop(b1_pdf)
+        _dump_json(json_out_b1, data_properties)
+        print(f"Extracted {len(data_properties)} substances -> {json_out_b1}")
+
+    return cached(b1_pdf, json_out_b1, produce)
+
+
+def _build_b2(b2_pdf: str, json_out_b2: str) -> bool:
+    def produce():
+        data_antoine = parse_antoine_table(b2_pdf)
+        _dump_json(json_out_b2, data_antoine)
+        print(f"Extracted {len(data_antoine)} antoine entries -> {json_out_b2}")
+
+    return cached(b2_pdf, json_out_b2, produce)
+
+
+def _build_lee_kesler(lee_kesler_pdf: str, json_out_lee_kesler: str) -> bool:
+    def produce():
+        data_lee = parse_lee_kesler_tables(lee_kesler_pdf)
+        _dump_json(json_out_lee_kesler, data_lee)
+        print(f"Extracted {len(data_lee)} tables -> {json_out_lee_kesler}")
+
+    return cached(lee_kesler_pdf, json_out_lee_kesler, produce)
+
+
+def _build_cp(cp_pdf: str, json_out_cp: str) -> bool:
+    def produce():
+        data_cp = parse_cp_tables(cp_pdf)
+        _dump_json(json_out_cp, data_cp)
+        print(f"Extracted CP tables -> {json_out_cp}")
+
+    return cached(cp_pdf, json_out_cp, produce)
+
+
 def main():
     pdf_source = "data/text.pdf"
     appendix_pdf = "data/appendix_BCD.pdf"
@@ -15,66 +74,37 @@ def main():
     json_out_lee_kesler = "data/lee_kesler.json"
     json_out_b1 = "data/b1_char_prop.json"
     json_out_b2 = "data/b2_antoine.json"
+    json_out_cp = "data/cp.json"
 
-    extractor.extract_pages(
-        input_pdf=pdf_source,
-        start=682,
-        end=711,
-        out=appendix_pdf,
-    )
-
-    #properties
-    extractor.extract_pages(
-        input_pdf=appendix_pdf,
-        start=1,
-        end=3,
-        out=b1_pdf
-    )
-
-    #antoine
-    extractor.extract_pages(
-        input_pdf=appendix_pdf,
-        start=4,
-        end=5,
-        out=b2_pdf
-    )
+    # The appendix must exist before the sub-extractions can read it
+    _extract_step(pdf_source, 682, 711, appendix_pdf)
 
-    #lee-kesler
-    extractor.extract_pages(
-        input_pdf=appendix_pdf,
-        start=14,
-        end=30,
-        out=lee_kesler_pdf
-    )
+    # The four sub-extractions only read appendix_pdf and are independent
+    extract_jobs = [
+        (b1_pdf, 1, 3),           # properties
+        (b2_pdf, 4, 5),           # antoine
+        (lee_kesler_pdf, 14, 30), # lee-kesler
+        (cp_pdf, 7, 9),           # heat capacity
+    ]
+    with ProcessPoolExecutor(max_workers=len(extract_jobs)) as ex:
+        futures = [
+            ex.submit(_extract_step, appendix_pdf, start, end, out)
+            for out, start, end in extract_jobs
+        ]
+        for future in futures:
+            future.result()
 
-    #heat capacity
-    extractor.extract_pages(
-        input_pdf=appendix_pdf,
-        start=7,
-        end=9,
-        out=cp_pdf
-    )
-
-    data_properties = parse_char_prop(b1_pdf)
-    Path(json_out_b1).parent.mkdir(parents=True, exist_ok=True)
-    with open(json_out_b1, "w") as f:
-        json.dump(data_properties, f, indent=2)
-    print(f"Extracted {len(data_properties)} substances -> {json_out_b1}")
-    data_antoine = parse_antoine_table(b2_pdf)
-    with open(json_out_b2, "w") as f:
-        json.dump(data_antoine, f, indent=2)
-    print(f"Extracted {len(data_antoine)} antoine entries -> {json_out_b2}")
-    data_lee = parse_lee_kesler_tables(lee_kesler_pdf)
-    Path(json_out_lee_kesler).parent.mkdir(parents=True, exist_ok=True)
-    with open(json_out_lee_kesler, "w") as f:
-        json.dump(data_lee, f, indent=2)
-    print(f"Extracted {len(data_lee)} tables -> {json_out_lee_kesler}")
-    
-    data_cp = parse_cp_tables(cp_pdf)
-    json_out_cp = "data/cp.json"
-    with open(json_out_cp, "w") as f:
-        json.dump(data_cp, f, indent=2)
-    print(f"Extracted CP tables -> {json_out_cp}")
+    # The parsers are independent and CPU-bound, so run them concurrently
+    parse_jobs = [
+        (_build_b1, b1_pdf, json_out_b1),
+        (_build_b2, b2_pdf, json_out_b2),
+        (_build_lee_kesler, lee_kesler_pdf, json_out_lee_kesler),
+        (_build_cp, cp_pdf, json_out_cp),
+    ]
+    with ProcessPoolExecutor(max_workers=len(parse_jobs)) as ex:
+        futures = [ex.submit(build, pdf, out) for build, pdf, out in parse_jobs]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+import hashlib
+import mmap
+from pathlib import Path
+
+
+def _sha256(path: str) -> str:
+    """Hash a file via mmap so large PDFs are not read into RAM twice."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        except ValueError:
+            # Empty files cannot be mmapped
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def cached(input_path: str, output_path: str, produce_fn, extra_key: str = "") -> bool:
+    """
+    Run produce_fn only when input_path changed since output_path was produced.
+
+    The SHA-256 of the input (plus an optional extra_key, e.g. a page range)
+    is stored in a sibling '<output_path>.sha256' stamp file. When the stamp
+    matches and the output still exists, produce_fn is skipped.
+
+    Parameters:
+    - input_path (str): File whose content keys the cache.
+    - output_path (str): File that produce_fn writes.
+    - produce_fn (callable): Zero-argument function that (re)builds the output.
+    - extra_key (str): Extra cache key material, e.g. "682-711" for a page range.
+
+    Returns True if produce_fn ran, False on a cache hit.
+    """
+    stamp_path = Path(output_path + ".sha256")
+    digest = _sha256(input_path)
+    if extra_key:
+        digest += ":" + extra_key
+
+    if Path(output_path).exists() and stamp_path.exists():
+        if stamp_path.read_text().strip() == digest:
+            print(f"Cache hit, skipping rebuild of {output_path}")
+            return False
+
+    produce_fn()
+    stamp_path.write_text(digest + "\n")
+    return True
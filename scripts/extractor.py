@@ -1,5 +1,5 @@
 from pathlib import Path
-from PyPDF2 import PdfReader, PdfWriter
+import pymupdf
 
 
 def extract_pages(
@@ -38,23 +38,23 @@ def extract_pages(
 
     print(f"Extracting pages {start} - {end} from {input_pdf}")
 
-    reader = PdfReader(input_path)
-    writer = PdfWriter()
+    src = pymupdf.open(input_path)
 
-    num_pages = len(reader.pages)
+    num_pages = src.page_count
 
     if start_idx >= num_pages or end_idx >= num_pages:
+        src.close()
         raise ValueError(f"PDF has only {num_pages} pages!")
 
-    for i in range(start_idx, end_idx + 1):
-        writer.add_page(reader.pages[i])
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "wb") as f:
-        writer.write(f)
+    dst = pymupdf.open()
+    dst.insert_pdf(src, from_page=start_idx, to_page=end_idx)
+    dst.save(output_path)
+    dst.close()
+    src.close()
 
     print(f"Saved extracted pages to {output_path.resolve()}")
 
 if __name__ == "__main__":
-    extract_pages("./text.pdf", 682, 711)
\ No newline at end of file
+    extract_pages("./text.pdf", 682, 711)
@@ -1,69 +1,106 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from PyPDF2 import PdfReader
+import pymupdf
+import numpy as np
 import re
 
 FLOAT = r"[-+]?(?:\d*\.\d+|\d+)"
 
-
-def is_data_row(line: str) -> bool:
+# Compiled once; the per-line loops below run this thousands of times
+_FLOAT_RE = re.compile(FLOAT)
+_FLOAT_ONLY_RE = re.compile(r"^[-+]?(?:\d*\.\d+|\d+)$")
+
+# Header/footer fragments for Tables B.1 and B.2, rejected in one scan
+# instead of a chain of substring checks
+_HEADER_RE = re.compile(
+    r"Table B\.\d|Molar mass|Critical properties|Substance|Constants|Formula"
+)
+
+# One translation table for all line cleanup: unicode minus/dash
+# normalization plus footnote-marker stripping, applied in a single
+# C-level pass instead of chained .replace() calls
+_TRANS = str.maketrans({
+    "−": "-",  # minus sign
+    "–": "-",  # en dash
+    "—": " ",  # em dash
+    "†": "",
+    "*": "",
+})
+
+
+def is_data_row(line: str, matches: list) -> bool:
     """
     A valid data row:
     - starts with a letter or digit (substance name)
-    - contains at least 6 numeric fields
+    - contains at least 6 numeric fields (the caller passes the float
+      matches it already found, so the line is only scanned once)
     """
-    nums = re.findall(FLOAT, line)
-    return len(nums) >= 6 and (line[0].isalpha() or line[0].isdigit())
+    return len(matches) >= 6 and (line[0].isalpha() or line[0].isdigit())
 
 
-def parse_char_prop(pdf_path: str) -> list:
-    """
-    Parse Table B.1 (Characteristics of Pure Substances).
+def _page_count(pdf_path: str) -> int:
+    doc = pymupdf.open(pdf_path)
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
 
-    Assumes:
-    - PDF contains ONLY the table pages
-    - No appendix boundary detection needed
+
+def _parse_char_prop_page(pdf_path: str, page_num: int) -> list:
     """
-    reader = PdfReader(pdf_path)
-    substances = []
+    Parse one page of Table B.1. Takes the path rather than an open
+    document so it can be shipped to a worker process; each worker opens
+    its own copy.
+    """
+    doc = pymupdf.open(pdf_path)
+    try:
+        text = doc[page_num].get_text("text")
+    finally:
+        doc.close()
 
-    for page in reader.pages:
-        text = page.extract_text()
-        if not text:
-            continue
+    substances = []
 
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
+    if text:
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line:
+                continue
 
-        for line in lines:
-            # Clean up special characters
-            line = line.replace("†", "").replace("*", "")
-            # Normalize unicode minus signs to ASCII hyphen
-            line = line.replace("\u2212", "-").replace("\u2013", "-")
+            # Clean special characters and normalize unicode minus signs
+            line = line.translate(_TRANS)
 
             # Skip known headers / footers
-            if (
-                "Table B.1" in line
-                or "Molar mass" in line
-                or "Critical properties" in line
-                or "Substance" in line
-            ):
+            if _HEADER_RE.search(line):
                 continue
 
-            if not is_data_row(line):
+            matches = list(_FLOAT_RE.finditer(line))
+            if not is_data_row(line, matches):
                 continue
 
-            matches = list(re.finditer(FLOAT, line))
-            if len(matches) < 6:
-                continue
+            # --- Fast path: full 7-column row (almost every line) ---
+            if len(matches) >= 7:
+                data_matches = matches[-7:]
+                name_end = data_matches[0].start()
+                name = line[:name_end].strip()
+
+                try:
+                    # One C-level conversion pass instead of seven float() calls
+                    mw, omega, tc, pc, zc, vc, tn = np.array(
+                        [m.group() for m in data_matches], dtype=np.float64
+                    ).tolist()
+                except ValueError:
+                    continue
 
             # --- Special case: 6 columns (Missing Omega OR Missing Tn) ---
-            if len(matches) == 6:
+            else:
                 name_end = matches[0].start()
                 name = line[:name_end].strip()
 
-                nums = [m.group() for m in matches]
-
                 try:
-                    vals = [float(n) for n in nums]
+                    vals = np.array(
+                        [m.group() for m in matches], dtype=np.float64
+                    ).tolist()
 
                     # Heuristic: Check 2nd number.
                     # If > 10, it is likely Tc (Missing Omega)
@@ -87,25 +124,6 @@ def parse_char_prop(pdf_path: str) -> list:
                 except ValueError:
                     continue
 
-            # --- Normal case: full 7-column row ---
-            else:
-                data_matches = matches[-7:]
-                name_end = data_matches[0].start()
-                name = line[:name_end].strip()
-
-                nums = [m.group() for m in data_matches]
-
-                try:
-                    mw = float(nums[0])
-                    omega = float(nums[1])
-                    tc = float(nums[2])
-                    pc = float(nums[3])
-                    zc = float(nums[4])
-                    vc = float(nums[5])
-                    tn = float(nums[6])
-                except ValueError:
-                    continue
-
             substances.append({
                 "name": name,
                 "mw": mw,
@@ -121,143 +139,202 @@ def parse_char_prop(pdf_path: str) -> list:
 
     return substances
 
-def parse_lee_kesler_tables(pdf_path: str) -> dict:
-    path = Path(pdf_path)
-    if not path.exists():
-        raise FileNotFoundError(f"{pdf_path} not found")
 
-    reader = PdfReader(path)
-    all_tables = {}
+def parse_char_prop(pdf_path: str) -> list:
+    """
+    Parse Table B.1 (Characteristics of Pure Substances).
+
+    Assumes:
+    - PDF contains ONLY the table pages
+    - No appendix boundary detection needed
+
+    Pages are independent, so they are parsed in parallel; results come
+    back in page order.
+    """
+    substances = []
+    with ProcessPoolExecutor() as ex:
+        for page_records in ex.map(
+            partial(_parse_char_prop_page, pdf_path), range(_page_count(pdf_path))
+        ):
+            substances.extend(page_records)
+    return substances
 
-    table_keys = {
-        "Z0": "z0",
-        "Z 1": "z1",
-        "Z1": "z1",
-        "( HR)0": "h0",
-        "( HR)1": "h1",
-        "( SR)0": "s0",
-        "( SR)1": "s1",
-        "ϕ0": "phi0",
-        "ϕ1": "phi1",
-    }
 
-    for page_num, page in enumerate(reader.pages):
-        text = page.extract_text()
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
+# Table D title fragments mapped to output keys
+_TABLE_KEYS = {
+    "Z0": "z0",
+    "Z 1": "z1",
+    "Z1": "z1",
+    "( HR)0": "h0",
+    "( HR)1": "h1",
+    "( SR)0": "s0",
+    "( SR)1": "s1",
+    "ϕ0": "phi0",
+    "ϕ1": "phi1",
+}
 
-        table_title = None
-        for line in lines:
-            if "Table D." in line and ":" in line:
-                table_title = line
-                break
 
-        if not table_title:
+def _parse_lee_kesler_page(pdf_path: str, page_num: int):
+    """
+    Parse one page of the Lee-Kesler tables. Returns (title, key,
+    table_data) or None for pages without a recognized table. Takes the
+    path so worker processes can open their own document.
+    """
+    doc = pymupdf.open(pdf_path)
+    try:
+        text = doc[page_num].get_text("text")
+    finally:
+        doc.close()
+
+    # Two passes over the lines below, so materialize once with a
+    # single strip per line
+    lines = list(filter(None, (l.strip() for l in text.splitlines())))
+
+    table_title = None
+    for line in lines:
+        if "Table D." in line and ":" in line:
+            table_title = line
+            break
+
+    if not table_title:
+        return None
+
+    key = None
+    for k, v in _TABLE_KEYS.items():
+        if k in table_title:
+            key = v
+            break
+
+    if not key:
+        return None
+
+    pressures = []
+    data_rows = []
+
+    for line in lines:
+        # Normalize unicode minus signs to ASCII hyphen
+        line = line.translate(_TRANS)
+
+        if "Pr =" in line:
+            pressures = [float(x) for x in _FLOAT_RE.findall(line)]
             continue
 
-        key = None
-        for k, v in table_keys.items():
-            if k in table_title:
-                key = v
-                break
+        try:
+            # Fast path: data rows are pure numeric grids, so the whole
+            # line tokenizes in one C-level pass
+            arr = np.array(line.split(), dtype=np.float64)
+        except ValueError:
+            # Header-mixed lines fall back to regex extraction
+            arr = np.array(_FLOAT_RE.findall(line), dtype=np.float64)
 
-        if not key:
+        if len(arr) < 2:
             continue
 
-        pressures = []
-        data_rows = []
+        z_vals = arr[1 : len(pressures) + 1]
 
-        for line in lines:
-            # Normalize unicode minus signs to ASCII hyphen
-            line = line.replace("\u2212", "-").replace("\u2013", "-")
+        if pressures and len(z_vals) == len(pressures):
+            data_rows.append((float(arr[0]), z_vals.tolist()))
 
-            if "Pr =" in line:
-                pressures = [float(x) for x in re.findall(FLOAT, line)]
-                continue
+    if not (pressures and data_rows):
+        return None
 
-            nums = re.findall(FLOAT, line)
-            if not nums or len(nums) < 2:
-                continue
+    table_data = {
+        "reduced_pressure": pressures,
+        "reduced_temperature": [r[0] for r in data_rows],
+        "values": [r[1] for r in data_rows],
+    }
+    return table_title, key, table_data
 
-            try:
-                tr = float(nums[0])
-            except ValueError:
-                continue
 
-            z_vals = []
-            for x in nums[1 : len(pressures) + 1]:
-                try:
-                    z_vals.append(float(x))
-                except ValueError:
-                    z_vals.append(None)
-
-            if z_vals and len(z_vals) == len(pressures):
-                data_rows.append((tr, z_vals))
-
-        if pressures and data_rows:
-            reduced_temperatures = [r[0] for r in data_rows]
-            matrix = [r[1] for r in data_rows]
-
-            table_data = {
-                "reduced_pressure": pressures,
-                "reduced_temperature": reduced_temperatures,
-                "values": matrix,
-            }
-
-            if key not in all_tables:
-                all_tables[key] = []
-            all_tables[key].append(table_data)
-
-            print(f"Parsed {table_title}: {len(data_rows)} rows")
-
-    # Combine low and high Pr tables
-    for key in all_tables:
-        if len(all_tables[key]) == 2:
-            t1, t2 = all_tables[key]
-            pr1 = t1["reduced_pressure"]
-            pr2 = t2["reduced_pressure"]
-            combined_pr = pr1 + pr2[1:]
-            combined_values = []
-            for r in range(len(t1["values"])):
-                row = t1["values"][r] + t2["values"][r][1:]
-                combined_values.append(row)
-            combined_table = {
-                "reduced_pressure": combined_pr,
-                "reduced_temperature": t1["reduced_temperature"],
-                "values": combined_values,
-            }
-            all_tables[key] = [combined_table]
+def _iter_page_tables(pdf_path: str):
+    """
+    Yield (title, key, table_data) for each page holding a recognized
+    table. Pages parse in parallel; results stream back in page order so
+    the low-Pr half of each pair always arrives first.
+    """
+    with ProcessPoolExecutor() as ex:
+        for result in ex.map(
+            partial(_parse_lee_kesler_page, pdf_path), range(_page_count(pdf_path))
+        ):
+            if result is not None:
+                yield result
 
-    return all_tables
 
-def parse_antoine_table(pdf_path: str) -> list:
-    reader = PdfReader(pdf_path)
-    substances = []
+def parse_lee_kesler_tables(pdf_path: str) -> dict:
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"{pdf_path} not found")
 
-    for page in reader.pages:
-        text = page.extract_text()
-        if not text:
+    all_tables = {}
+    # Low-Pr halves waiting for their high-Pr partner. Merging as the
+    # second half streams in frees the first immediately instead of
+    # holding every table until a post-processing pass.
+    pending = {}
+
+    for table_title, key, table_data in _iter_page_tables(str(path)):
+        print(f"Parsed {table_title}: {len(table_data['values'])} rows")
+
+        first = pending.pop(key, None)
+        if first is None:
+            if key in all_tables:
+                # More than two tables for one key: keep extras unmerged
+                all_tables[key].append(table_data)
+            else:
+                pending[key] = table_data
             continue
 
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
+        # Combine the low and high Pr halves. One C-level allocation
+        # instead of a fresh list per row; the first high-Pr column
+        # duplicates the last low-Pr one.
+        combined_pr = first["reduced_pressure"] + table_data["reduced_pressure"][1:]
+        m1 = np.asarray(first["values"])
+        m2 = np.asarray(table_data["values"])
+        all_tables[key] = [{
+            "reduced_pressure": combined_pr,
+            "reduced_temperature": first["reduced_temperature"],
+            "values": np.hstack([m1, m2[:, 1:]]).tolist(),
+        }]
+
+    # Tables that never saw a second half pass through unmerged
+    for key, table_data in pending.items():
+        all_tables[key] = [table_data]
+
+    return all_tables
+
+def _parse_antoine_page(pdf_path: str, page_num: int) -> list:
+    """
+    Parse one page of Table B.2 (Antoine constants). Takes the path so
+    worker processes can open their own document.
+    """
+    doc = pymupdf.open(pdf_path)
+    try:
+        text = doc[page_num].get_text("text")
+    finally:
+        doc.close()
+
+    substances = []
+
+    if text:
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line:
+                continue
 
-        for line in lines:
             # Skip headers
-            if "Table B.2" in line or "Constants" in line or "Formula" in line:
+            if _HEADER_RE.search(line):
                 continue
 
-            # Clean up special characters
-            line = line.replace("†", "").replace("*", "")
-            # Normalize unicode minus signs and separators
-            line = line.replace("\u2212", "-").replace("\u2013", "-").replace("\u2014", " ")
+            # Clean special characters and normalize unicode minus signs / separators
+            line = line.translate(_TRANS)
 
             # Find numbers
             # We expect 7 numbers: A, B, C, tmin, tmax, H, tn
-            nums = re.findall(FLOAT, line)
-            if len(nums) < 7:
+            matches = list(_FLOAT_RE.finditer(line))
+            if len(matches) < 7:
                 continue
 
             # The last 7 matches are likely our data
-            data_matches = list(re.finditer(FLOAT, line))[-7:]
+            data_matches = matches[-7:]
 
             # Name and Formula are before the first number (A)
             first_num_idx = data_matches[0].start()
@@ -293,9 +370,21 @@ def parse_antoine_table(pdf_path: str) -> list:
 
     return substances
 
+
+def parse_antoine_table(pdf_path: str) -> list:
+    """Parse Table B.2, with the independent pages parsed in parallel."""
+    substances = []
+    with ProcessPoolExecutor() as ex:
+        for page_records in ex.map(
+            partial(_parse_antoine_page, pdf_path), range(_page_count(pdf_path))
+        ):
+            substances.extend(page_records)
+    return substances
+
+
 def parse_cp_tables(pdf_path: str) -> dict:
-    reader = PdfReader(pdf_path)
-    
+    doc = pymupdf.open(pdf_path)
+
     tables = {
         "gases": [],
         "solids": [],
@@ -322,21 +411,23 @@ def parse_cp_tables(pdf_path: str) -> dict:
         if s == "MISSING":
             return True
         s = s.replace("−", "-").replace("\u2212", "-")
-        return bool(re.match(r'^[-+]?(?:\d*\.\d+|\d+)$', s))
+        return bool(_FLOAT_ONLY_RE.match(s))
 
-    for page_num, page in enumerate(reader.pages):
-        text = page.extract_text()
+    for page_num, page in enumerate(doc):
+        text = page.get_text("text")
         if not text:
             continue
-            
+
         # Hardcode page start types for known layout if header is missing/late
         if page_num == 1: # Page 2: Starts with Solids
             if current_table == "gases":
                 current_table = "solids"
 
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-        
-        for line in lines:
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+
             # Detect table headers
             if "Table C.1" in line or "Ideal-Gas State" in line:
                 current_table = "gases"
@@ -372,7 +463,7 @@ def parse_cp_tables(pdf_path: str) -> dict:
 
             # Normalize line
             # 1. replace unicode minus
-            cleaned_line = line.replace("\u2212", "-").replace("\u2013", "-").replace("−", "-")
+            cleaned_line = line.translate(_TRANS)
             # 2. replace dots
             cleaned_line = re_dots.sub(' MISSING ', cleaned_line)
             
@@ -1,6 +1,10 @@
 import json
 import os
+import matplotlib
+matplotlib.use("Agg")  # headless: skip GUI backend init, this only writes a PNG
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 
 def main():
@@ -18,27 +22,49 @@ def main():
         return
 
     plt.figure(figsize=(10, 8))
-    
-    # Define a color map or list of colors
-    colors = plt.cm.viridis(np.linspace(0, 1, len(data)))
 
-    for i, (name, points) in enumerate(data.items()):
+    # Default color cycle, assigned per isotherm as plt.plot would
+    color_cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+
+    # Isotherms are batched into one LineCollection artist instead of a
+    # plt.plot call per curve; legend handles are built as proxies
+    segments = []
+    segment_colors = []
+    handles = []
+
+    for name, points in data.items():
         if not points:
             continue
-        
-        pr = [p['p_r'] for p in points]
-        rho = [p['rho_r'] for p in points]
-        
+
+        if isinstance(points, dict):
+            pr = points['p_r']
+            rho = points['rho_r']
+        else:
+            # Legacy row-oriented schema: one dict per point
+            pr = [p['p_r'] for p in points]
+            rho = [p['rho_r'] for p in points]
+
         # Plot
         if name == "-1":
-            plt.plot(pr, rho, label="Saturation", color='black', linewidth=2, linestyle='--')
+            sat_line, = plt.plot(pr, rho, label="Saturation", color='black', linewidth=2, linestyle='--')
+            handles.append(sat_line)
         else:
-            plt.plot(pr, rho, label=fr"$T_r = {name}$")
+            color = color_cycle[len(segments) % len(color_cycle)]
+            segments.append(np.column_stack([pr, rho]))
+            segment_colors.append(color)
+            handles.append(Line2D([0], [0], color=color, label=fr"$T_r = {name}$"))
+
+    if segments:
+        plt.gca().add_collection(
+            LineCollection(segments, colors=segment_colors, linewidths=1.5)
+        )
 
     plt.xlabel(r'Reduced Pressure ($P_r$)')
     plt.ylabel(r'Reduced Density ($\rho_r$)')
     plt.title('Lydersen Chart (Reconstructed)')
-    plt.legend()
+    # "best" placement ignores LineCollection vertices, so pin the legend
+    # to the empty lower-right region
+    plt.legend(handles=handles, loc='lower right')
     plt.grid(True, which='both', linestyle='--', linewidth=0.5)
     plt.xlim(0, 10)
     plt.ylim(0, 3.5)
@@ -1,8 +1,14 @@
-import json
 import os
 import numpy as np
+import orjson
 from scipy.interpolate import PchipInterpolator, UnivariateSpline
 
+def _extend_to(pr_list, rho_list, end_at):
+    """Linearly extrapolate the last segment so the curve ends at Pr = end_at."""
+    slope = (rho_list[-1] - rho_list[-2]) / (pr_list[-1] - pr_list[-2])
+    rho_list.append(rho_list[-1] + slope * (end_at - pr_list[-1]))
+    pr_list.append(end_at)
+
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
@@ -11,8 +17,8 @@ def main():
 
     print(f"Reading from {input_path}")
     try:
-        with open(input_path, 'r') as f:
-            raw_data = json.load(f)
+        with open(input_path, 'rb') as f:
+            raw_data = orjson.loads(f.read())
     except FileNotFoundError:
         print(f"Error: Could not find {input_path}")
         return
@@ -21,82 +27,76 @@ def main():
 
     # Normalization Rules
     # Tr sets
-    start_zero_tr = ["Tr_0.3", "Tr_0.4", "Tr_0.5", "Tr_0.6"]
-    end_ten_tr = ["Tr_0.3", "Tr_0.4", "Tr_0.5", "Tr_0.6", "Tr_0.7", "Tr_0.8", "Tr_0.9", "Tr_1.0"]
-    end_four_tr = ["Tr_0.97", "Tr_0.99"]
+    start_zero_tr = frozenset(["Tr_0.3", "Tr_0.4", "Tr_0.5", "Tr_0.6"])
+    end_ten_tr = frozenset(["Tr_0.3", "Tr_0.4", "Tr_0.5", "Tr_0.6", "Tr_0.7", "Tr_0.8", "Tr_0.9", "Tr_1.0"])
+    end_four_tr = frozenset(["Tr_0.97", "Tr_0.99"])
     
     # Process each dataset
     for name, points in raw_data.items():
         if not points:
             continue
             
-        pts = np.array(points)
-        pr = pts[:, 0]
-        rho = pts[:, 1]
+        # Endpoint fixing happens on plain lists: np.insert/np.append copy the
+        # whole array on every call, so build the padded data first and
+        # convert to an ndarray exactly once.
+        pr_list = [float(p[0]) for p in points]
+        rho_list = [float(p[1]) for p in points]
 
         # 1. Normalization (Fixing Endpoints)
-        
+
         # Start at Pr = 0
         if name in start_zero_tr:
             # If the first point is not 0, insert 0.
-            if pr[0] > 0.001:
+            if pr_list[0] > 0.001:
                 # Prepend 0. Use the same density as the first point (incompressible assumption)
-                pr = np.insert(pr, 0, 0.0)
-                rho = np.insert(rho, 0, rho[0])
+                pr_list.insert(0, 0.0)
+                rho_list.insert(0, rho_list[0])
             else:
-                pr[0] = 0.0
+                pr_list[0] = 0.0
 
         # End at Pr = 10
         if name in end_ten_tr:
-            if pr[-1] < 9.99:
-                slope = (rho[-1] - rho[-2]) / (pr[-1] - pr[-2])
-                new_rho = rho[-1] + slope * (10.0 - pr[-1])
-                pr = np.append(pr, 10.0)
-                rho = np.append(rho, new_rho)
+            if pr_list[-1] < 9.99:
+                _extend_to(pr_list, rho_list, 10.0)
             else:
-                pr[-1] = 10.0
+                pr_list[-1] = 10.0
 
         # End at Pr = 4
         if name in end_four_tr:
-            if pr[-1] < 3.99:
-                slope = (rho[-1] - rho[-2]) / (pr[-1] - pr[-2])
-                new_rho = rho[-1] + slope * (4.0 - pr[-1])
-                pr = np.append(pr, 4.0)
-                rho = np.append(rho, new_rho)
+            if pr_list[-1] < 3.99:
+                _extend_to(pr_list, rho_list, 4.0)
             else:
-                pr[-1] = 4.0
+                pr_list[-1] = 4.0
 
         # Saturation Curve
         if name == "sat":
             # Start at Pr = 0
-            if pr[0] > 0.001:
-                pr = np.insert(pr, 0, 0.0)
-                rho = np.insert(rho, 0, rho[0]) # Extrapolate/Duplicate
+            if pr_list[0] > 0.001:
+                pr_list.insert(0, 0.0)
+                rho_list.insert(0, rho_list[0]) # Extrapolate/Duplicate
             else:
-                pr[0] = 0.0
-            
+                pr_list[0] = 0.0
+
             # End at Pr = 1, rho_r = 1
             # Force the last point to be (1, 1)
             # If the last point is close to 1, replace it. Else append.
-            if pr[-1] < 0.99:
-                pr = np.append(pr, 1.0)
-                rho = np.append(rho, 1.0)
+            if pr_list[-1] < 0.99:
+                pr_list.append(1.0)
+                rho_list.append(1.0)
             else:
-                pr[-1] = 1.0
-                rho[-1] = 1.0
+                pr_list[-1] = 1.0
+                rho_list[-1] = 1.0
+
+        pr = np.asarray(pr_list, dtype=np.float64)
+        rho = np.asarray(rho_list, dtype=np.float64)
 
         # 2. Smoothing with PCHIP
         # We create a PCHIP interpolator
         # Ensure strictly increasing Pr for PCHIP
         # Remove duplicates if any
-        unique_indices = np.unique(pr, return_index=True)[1]
-        pr_clean = pr[unique_indices]
+        # np.unique returns sorted values, so no extra sorting pass is needed
+        pr_clean, unique_indices = np.unique(pr, return_index=True)
         rho_clean = rho[unique_indices]
-        
-        # Sort again just in case unique messed up order (it shouldn't if sorted)
-        sorted_indices = np.argsort(pr_clean)
-        pr_clean = pr_clean[sorted_indices]
-        rho_clean = rho_clean[sorted_indices]
 
         try:
             if name == "sat":
@@ -111,7 +111,8 @@ def main():
                 interpolator = UnivariateSpline(pr_clean, rho_clean, w=weights, s=0.005)
         except Exception as e:
             print(f"Failed to interpolate {name}: {e}")
-            processed_data[name] = points # Fallback
+            # Fallback: raw points in the same columnar shape
+            processed_data[name] = {"p_r": pr_list, "rho_r": rho_list}
             continue
 
         # 3. Resampling
@@ -153,16 +154,17 @@ def main():
         else:
             key = name
 
-        processed_points = []
-        for px, py in zip(x_new, y_new):
-            processed_points.append({"p_r": px, "rho_r": py})
-            
-        processed_data[key] = processed_points
-        print(f"Processed {name} -> {key}: {len(processed_points)} points")
+        # Columnar output: no per-point dicts, and OPT_SERIALIZE_NUMPY lets
+        # orjson encode the arrays without a tolist() round-trip
+        processed_data[key] = {"p_r": x_new, "rho_r": y_new}
+        print(f"Processed {name} -> {key}: {len(x_new)} points")
 
     print(f"Writing to {output_path}")
-    with open(output_path, 'w') as f:
-        json.dump(processed_data, f, indent=4)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(
+            processed_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ))
     print("Done.")
 
 if __name__ == "__main__":